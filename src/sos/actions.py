@@ -19,7 +19,7 @@ import urllib.parse
 import urllib.request
 import uuid
 import zipfile
-from collections import Sequence
+from collections.abc import Sequence
 from functools import wraps
 
 from tqdm import tqdm as ProgressBar
@@ -804,15 +804,19 @@ def downloadURL(URL, dest, decompress=False, index=None):
                         leave=False)
                 except Exception:
                     file_size = None
-                file_size_dl = 0
-                block_sz = 8192
+                # a larger block means fewer read/write/update calls
+                # per downloaded megabyte; tqdm rate-limits its own
+                # screen updates so the bar stays smooth
+                block_sz = 65536
+                read = u.read
+                write = f.write
+                update = prog.update
                 while True:
-                    buffer = u.read(block_sz)
+                    buffer = read(block_sz)
                     if not buffer:
                         break
-                    file_size_dl += len(buffer)
-                    f.write(buffer)
-                    prog.update(len(buffer))
+                    write(buffer)
+                    update(len(buffer))
             except urllib.error.HTTPError as e:
                 prog.set_description(message +
                                      f':\033[91m {e.code} Error\033[0m')
@@ -256,140 +256,185 @@ class Controller(threading.Thread):
         #          self.event_map[value] = name
         self.console_logger = None
 
+        # dispatch tables for the push and request sockets; a single
+        # dict lookup replaces the if/elif chains over message types
+        self._push_handlers = {
+            'substep': self._handle_push_job,
+            'step': self._handle_push_job,
+            'workflow': self._handle_push_job,
+            'nprocs': self._handle_push_nprocs,
+            'progress': self._handle_push_progress,
+            'workflow_sig': self._handle_push_workflow_sig,
+            'step_sig': self._handle_push_step_sig,
+            'commit_sig': self._handle_push_commit_sig,
+        }
+        self._request_handlers = {
+            'workflow_sig': self._handle_req_workflow_sig,
+            'step_sig': self._handle_req_step_sig,
+            'nprocs': self._handle_req_nprocs,
+            'sos_step': self._handle_req_sos_step,
+            'step_output': self._handle_req_step_output,
+            'named_output': self._handle_req_named_output,
+            'worker_available': self._handle_req_worker_available,
+            'done': self._handle_req_done,
+        }
+
+    def _handle_push_job(self, msg):
+        # cache the request, route to first available worker
+        self.workers.add_request(msg[0], msg[1])
+
+    def _handle_push_nprocs(self, msg):
+        if 'CONTROLLER' in env.config['SOS_DEBUG'] or 'ALL' in env.config['SOS_DEBUG']:
+            env.log_to_file('CONTROLLER',
+                            f'Active running process set to {msg[1]}')
+        self._nprocs = msg[1]
+
+    def _handle_push_progress(self, msg):
+        if msg[1] == 'substep_ignored':
+            self._ignored[msg[2]] += 1
+        elif msg[1] == 'substep_completed':
+            self._completed[msg[2]] += 1
+        elif msg[1] == 'step_completed':
+            self._completed_steps[msg[3]] = msg[4]
+        if env.verbosity == 1 and env.config['run_mode'] != 'interactive':
+            # update progress bar
+            self._progress_bar.update(msg[1], msg[2] if len(msg) > 2 else None)
+
+    def _handle_push_workflow_sig(self, msg):
+        self.workflow_signatures.write(*msg[1:])
+
+    def _handle_push_step_sig(self, msg):
+        self.step_signatures.set(*msg[1:])
+
+    def _handle_push_commit_sig(self, msg):
+        self.workflow_signatures.commit()
+        self.step_signatures.commit()
+
     def handle_master_push_msg(self, msg):
         try:
-            if msg[0] in ('substep', 'step', 'workflow'):
-                # cache the request, route to first available worker
-                self.workers.add_request(msg[0], msg[1])
-            elif msg[0] == 'nprocs':
-                if 'CONTROLLER' in env.config['SOS_DEBUG'] or 'ALL' in env.config['SOS_DEBUG']:
-                    env.log_to_file('CONTROLLER',
-                                    f'Active running process set to {msg[1]}')
-                self._nprocs = msg[1]
-            elif msg[0] == 'progress':
-                if msg[1] == 'substep_ignored':
-                    self._ignored[msg[2]] += 1
-                elif msg[1] == 'substep_completed':
-                    self._completed[msg[2]] += 1
-                elif msg[1] == 'step_completed':
-                    self._completed_steps[msg[3]] = msg[4]
-                if env.verbosity == 1 and env.config[
-                        'run_mode'] != 'interactive':
-                    # update progress bar
-                    self._progress_bar.update(msg[1],
-                                              msg[2] if len(msg) > 2 else None)
-            elif msg[0] == 'workflow_sig':
-                self.workflow_signatures.write(*msg[1:])
-            elif msg[0] == 'step_sig':
-                self.step_signatures.set(*msg[1:])
-            elif msg[0] == 'commit_sig':
-                self.workflow_signatures.commit()
-                self.step_signatures.commit()
-            else:
+            handler = self._push_handlers.get(msg[0])
+            if handler is None:
                 env.logger.warning(f'Unknown message passed {msg}')
+            else:
+                handler(msg)
         except Exception as e:
             env.logger.warning(
                 f'Failed to handle master push message {msg}: {e}')
 
-    def handle_master_request_msg(self, msg):
-        try:
-            # make sure all records have been saved before returning information
+    def _drain_push_socket(self):
+        # receive with NOBLOCK until EAGAIN instead of paying one
+        # poll(0) syscall per message
+        while True:
+            try:
+                msg = self.master_push_socket.recv_pyobj(zmq.NOBLOCK)
+            except zmq.Again:
+                break
+            self.handle_master_push_msg(msg)
+
+    def _handle_req_workflow_sig(self, msg):
+        if msg[1] == 'clear':
+            self.workflow_signatures.clear()
+            self.master_request_socket.send_pyobj('ok')
+        elif msg[1] == 'placeholders':
+            self.master_request_socket.send_pyobj(
+                self.workflow_signatures.placeholders(msg[2]))
+        elif msg[1] == 'records':
+            self.master_request_socket.send_pyobj(
+                self.workflow_signatures.records(msg[2]))
+        else:
+            env.logger.warning(f'Unknown signature request {msg}')
+        return True
+
+    def _handle_req_step_sig(self, msg):
+        if msg[1] == 'get':
+            self.master_request_socket.send_pyobj(
+                self.step_signatures.get(*msg[2:]))
+        else:
+            env.logger.warning(f'Unknown signature request {msg}')
+        return True
+
+    def _handle_req_nprocs(self, msg):
+        self.master_request_socket.send_pyobj(self._nprocs)
+        return True
+
+    def _handle_req_sos_step(self, msg):
+        self.master_request_socket.send_pyobj(
+            msg[1] in self._completed_steps or msg[1] in
+            [x.rsplit('_', 1)[0] for x in self._completed_steps.keys()])
+        return True
+
+    def _handle_req_step_output(self, msg):
+        step_name = msg[1]
+        if step_name in self._completed_steps:
+            self.master_request_socket.send_pyobj(
+                self._completed_steps[step_name])
+        else:
+            # now, step_name might actually be a workflow name, in which
+            # case we need to return the last step of the workflow
+            steps = sorted([
+                x for x in self._completed_steps.keys()
+                if x.rsplit('_', 1)[0] == step_name
+            ])
+            self.master_request_socket.send_pyobj(
+                self._completed_steps[steps[-1]] if steps else None)
+        return True
+
+    def _handle_req_named_output(self, msg):
+        name = msg[1]
+        found = False
+        for step_output in self._completed_steps.values():
+            if name in step_output.labels:
+                found = True
+                self.master_request_socket.send_pyobj(step_output[name])
+                break
+        if not found:
+            self.master_request_socket.send_pyobj(None)
+        return True
+
+    def _handle_req_worker_available(self, msg):
+        self.master_request_socket.send_pyobj(
+            self.workers.worker_available(msg[1], msg[2:]))
+        return True
+
+    def _handle_req_done(self, msg):
+        # handle all ctl_push_msgs #1062
+        self._drain_push_socket()
+
+        # handle all push request from logging
+        if env.config['exec_mode'] in ('master', 'both'):
             while True:
-                if self.master_push_socket.poll(0):
-                    self.handle_master_push_msg(
-                        self.master_push_socket.recv_pyobj())
-                else:
+                try:
+                    logging_msg = self.tapping_logging_socket.recv_multipart(
+                        zmq.NOBLOCK)
+                except zmq.Again:
                     break
-            if msg[0] == 'workflow_sig':
-                if msg[1] == 'clear':
-                    self.workflow_signatures.clear()
-                    self.master_request_socket.send_pyobj('ok')
-                elif msg[1] == 'placeholders':
-                    self.master_request_socket.send_pyobj(
-                        self.workflow_signatures.placeholders(msg[2]))
-                elif msg[1] == 'records':
-                    self.master_request_socket.send_pyobj(
-                        self.workflow_signatures.records(msg[2]))
-                else:
-                    env.logger.warning(f'Unknown signature request {msg}')
-            elif msg[0] == 'step_sig':
-                if msg[1] == 'get':
-                    self.master_request_socket.send_pyobj(
-                        self.step_signatures.get(*msg[2:]))
-                else:
-                    env.logger.warning(f'Unknown signature request {msg}')
-            elif msg[0] == 'nprocs':
-                self.master_request_socket.send_pyobj(self._nprocs)
-            elif msg[0] == 'sos_step':
-                self.master_request_socket.send_pyobj(
-                    msg[1] in self._completed_steps or msg[1] in
-                    [x.rsplit('_', 1)[0] for x in self._completed_steps.keys()])
-            elif msg[0] == 'step_output':
-                step_name = msg[1]
-                if step_name in self._completed_steps:
-                    self.master_request_socket.send_pyobj(
-                        self._completed_steps[step_name])
-                else:
-                    # now, step_name might actually be a workflow name, in which
-                    # case we need to return the last step of the workflow
-                    steps = sorted([
-                        x for x in self._completed_steps.keys()
-                        if x.rsplit('_', 1)[0] == step_name
-                    ])
-                    self.master_request_socket.send_pyobj(
-                        self._completed_steps[steps[-1]] if steps else None)
-            elif msg[0] == 'named_output':
-                name = msg[1]
-                found = False
-                for step_output in self._completed_steps.values():
-                    if name in step_output.labels:
-                        found = True
-                        self.master_request_socket.send_pyobj(step_output[name])
-                        break
-                if not found:
-                    self.master_request_socket.send_pyobj(None)
-            elif msg[0] == 'worker_available':
-                self.master_request_socket.send_pyobj(
-                    self.workers.worker_available(msg[1], msg[2:]))
-            elif msg[0] == 'done':
-                # handle all ctl_push_msgs #1062
-                while True:
-                    if self.master_push_socket.poll(0):
-                        self.handle_master_push_msg(
-                            self.master_push_socket.recv_pyobj())
-                    else:
-                        break
+                self.handle_tapping_logging_msg(logging_msg)
 
-                # handle all push request from logging
-                if env.config['exec_mode'] in ('master', 'both'):
-                    while True:
-                        if self.tapping_logging_socket.poll(0):
-                            self.handle_tapping_logging_msg(
-                                self.tapping_logging_socket.recv_multipart())
-                        else:
-                            break
+        if env.verbosity == 1 and env.config['run_mode'] != 'interactive':
+            num_steps = len(
+                set(self._completed.keys()) | set(self._ignored.keys()))
+            num_completed = sum(self._completed.values())
+            num_ignored = sum(self._ignored.values())
+            completed_text = f'{num_completed} job{"s" if num_completed > 1 else ""} completed' if num_completed else ''
+            ignored_text = f'{num_ignored} job{"s" if num_ignored > 1 else ""} ignored' if num_ignored else ''
+            steps_text = f'{num_steps} step{"s" if num_steps > 1 else ""} processed'
+            succ = '' if msg[1] else 'Failed with '
+            self._progress_bar.done(
+                f'{succ}{steps_text} ({completed_text}{", " if num_completed and num_ignored else ""}{ignored_text})'
+            )
 
-                if env.verbosity == 1 and env.config[
-                        'run_mode'] != 'interactive':
-                    num_steps = len(
-                        set(self._completed.keys())
-                        | set(self._ignored.keys()))
-                    num_completed = sum(self._completed.values())
-                    num_ignored = sum(self._ignored.values())
-                    completed_text = f'{num_completed} job{"s" if num_completed > 1 else ""} completed' if num_completed else ''
-                    ignored_text = f'{num_ignored} job{"s" if num_ignored > 1 else ""} ignored' if num_ignored else ''
-                    steps_text = f'{num_steps} step{"s" if num_steps > 1 else ""} processed'
-                    succ = '' if msg[1] else 'Failed with '
-                    self._progress_bar.done(
-                        f'{succ}{steps_text} ({completed_text}{", " if num_completed and num_ignored else ""}{ignored_text})'
-                    )
-
-                self.master_request_socket.send_pyobj('bye')
-
-                return False
-            else:
+        self.master_request_socket.send_pyobj('bye')
+
+        return False
+
+    def handle_master_request_msg(self, msg):
+        try:
+            # make sure all records have been saved before returning information
+            self._drain_push_socket()
+            handler = self._request_handlers.get(msg[0])
+            if handler is None:
                 raise RuntimeError(f'Unrecognized request {msg}')
-            return True
+            return handler(msg)
         except Exception as e:
             env.logger.warning(f'Failed to respond controller {msg}: {e}')
             self.master_request_socket.send_pyobj(None)
@@ -520,12 +565,7 @@ class Controller(threading.Thread):
                     self.workers.check_workers()
 
                 if self.master_push_socket in socks:
-                    while True:
-                        if self.master_push_socket.poll(0):
-                            self.handle_master_push_msg(
-                                self.master_push_socket.recv_pyobj())
-                        else:
-                            break
+                    self._drain_push_socket()
 
                 if self.master_request_socket in socks:
                     if not self.handle_master_request_msg(
@@ -534,11 +574,12 @@ class Controller(threading.Thread):
 
                 if self.worker_backend_socket in socks:
                     while True:
-                        if self.worker_backend_socket.poll(0):
-                            self.handle_worker_backend_msg(
-                                self.worker_backend_socket.recv_pyobj())
-                        else:
+                        try:
+                            backend_msg = self.worker_backend_socket.recv_pyobj(
+                                zmq.NOBLOCK)
+                        except zmq.Again:
                             break
+                        self.handle_worker_backend_msg(backend_msg)
 
                 if env.config['exec_mode'] == 'master':
                     if self.tapping_logging_socket in socks:
@@ -10,9 +10,10 @@ import sys
 import re
 import psutil
 import traceback
+import weakref
 
 from typing import Any
-from collections import Sequence
+from collections.abc import Sequence
 from io import StringIO
 from tokenize import generate_tokens
 
@@ -179,6 +180,29 @@ def get_traceback_msg(e):
         return f'{error_class}: {detail}'
 
 
+# compiled global definitions, keyed (weakly, to follow the lifetime of
+# the workflow) by the AST or source they came from, so that preparing
+# the same step or workflow repeatedly does not recompile its globals.
+# The code object cannot be cached on the AST itself because sections
+# are pickled to workers and code objects do not pickle.
+_gdef_code_cache = weakref.WeakKeyDictionary()
+_gdef_str_code_cache = {}
+
+
+def _compile_gdef(gdef):
+    if isinstance(gdef, str):
+        code = _gdef_str_code_cache.get(gdef)
+        if code is None:
+            code = _gdef_str_code_cache[gdef] = compile(
+                gdef, filename="<ast>", mode="exec")
+        return code
+    code = _gdef_code_cache.get(gdef)
+    if code is None:
+        code = _gdef_code_cache[gdef] = compile(
+            gdef, filename="<ast>", mode="exec")
+    return code
+
+
 def prepare_env(gdef='', gvars={}, extra_vars={}, host='localhost'):
     '''clear current sos_dict, execute global_def (definitions and imports),
     and inject global variables'''
@@ -190,7 +214,7 @@ def prepare_env(gdef='', gvars={}, extra_vars={}, host='localhost'):
         gdef, gvars = analyze_global_statements('')
 
     if gdef:
-        exec(compile(gdef, filename="<ast>", mode="exec"), env.sos_dict._dict)
+        exec(_compile_gdef(gdef), env.sos_dict._dict)
 
     env.sos_dict.quick_update(gvars)
     env.sos_dict.quick_update(extra_vars)
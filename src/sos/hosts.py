@@ -10,7 +10,7 @@ import socket
 import stat
 import subprocess
 import sys
-from collections import Sequence
+from collections.abc import Sequence
 
 import pexpect
 import pkg_resources
@@ -9,7 +9,8 @@ import os
 import subprocess
 import sys
 import time
-from collections import Iterable, Mapping, Sequence, defaultdict
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
 from typing import List
 
 import zmq
@@ -12,7 +12,7 @@ import shlex
 import shutil
 import subprocess
 import sys
-from collections import Iterable, Sequence
+from collections.abc import Iterable, Sequence
 from copy import deepcopy
 from itertools import combinations, tee
 from pathlib import Path, WindowsPath, PosixPath
@@ -677,7 +677,14 @@ class path(type(Path())):
         return str(self) < str(other)
 
     def __hash__(self):
-        return hash(repr(self))
+        # paths are immutable so the hash is computed only once;
+        # building repr() on every hash call is expensive for targets
+        # that are constantly looked up in sets and dictionaries
+        try:
+            return self._hash_value
+        except AttributeError:
+            self._hash_value = hash(repr(self))
+            return self._hash_value
 
     def zap(self):
         zap_file = self + '.zapped'
@@ -798,7 +805,11 @@ class file_target(path, BaseTarget):
             )
 
     def __hash__(self):
-        return hash(repr(self))
+        try:
+            return self._hash_value
+        except AttributeError:
+            self._hash_value = hash(repr(self))
+            return self._hash_value
 
     def __eq__(self, obj):
         return isinstance(
@@ -8,7 +8,8 @@ import subprocess
 import time
 import signal
 
-from collections import OrderedDict, Mapping, Sequence
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from contextlib import redirect_stdout, redirect_stderr
 
 from .eval import SoS_eval, SoS_exec
@@ -1557,26 +1557,28 @@ def purge_tasks(tasks,
                 os.path.join(
                     os.path.expanduser('~'), '.sos', 'tasks', x + '.task'))
         ]
-    import glob
+    # a single scandir pass gives both names and mtimes of all task
+    # files, instead of one glob per task plus one stat per file
+    tasks_dir = os.path.join(os.path.expanduser('~'), '.sos', 'tasks')
+    try:
+        with os.scandir(tasks_dir) as entries:
+            task_entries = [(entry.name, entry.stat().st_mtime)
+                            for entry in entries
+                            if entry.name.endswith('.task')]
+    except OSError:
+        task_entries = []
     if tasks:
         all_tasks = []
         for t in tasks:
-            matched = glob.glob(
-                os.path.join(
-                    os.path.expanduser('~'), '.sos', 'tasks', f'{t}*.task'))
-            matched = [
-                (os.path.basename(x)[:-5], os.path.getmtime(x)) for x in matched
-            ]
+            matched = [(name[:-5], mtime)
+                       for name, mtime in task_entries
+                       if name.startswith(t)]
             if not matched:
                 print(f'{t}\tmissing')
             all_tasks.extend(matched)
         is_all = False
     elif purge_all:
-        tasks = glob.glob(
-            os.path.join(os.path.expanduser('~'), '.sos', 'tasks', '*.task'))
-        all_tasks = [
-            (os.path.basename(x)[:-5], os.path.getmtime(x)) for x in tasks
-        ]
+        all_tasks = [(name[:-5], mtime) for name, mtime in task_entries]
         is_all = True
     else:
         env.logger.info('No relevant task to remove.')
@@ -1647,21 +1649,24 @@ def purge_tasks(tasks,
     elif verbosity > 1:
         env.logger.debug('No matching tasks to purge')
     if purge_all and age is None and status is None and tags is None:
-        matched = glob.glob(
-            os.path.join(os.path.expanduser('~'), '.sos', 'tasks', '*'))
+        try:
+            matched = list(os.scandir(tasks_dir))
+        except OSError:
+            matched = []
         count = 0
-        for f in matched:
-            if os.path.isdir(f):
+        for entry in matched:
+            if entry.is_dir():
                 import shutil
                 try:
-                    shutil.rmtree(f)
+                    shutil.rmtree(entry.path)
                     count += 1
                 except Exception as e:
                     if verbosity > 0:
-                        env.logger.warning(f'Failed to remove {f}: {e}')
+                        env.logger.warning(
+                            f'Failed to remove {entry.path}: {e}')
             else:
                 try:
-                    os.remove(f)
+                    os.remove(entry.path)
                     count += 1
                 except Exception as e:
                     if verbosity > 0:
@@ -5,6 +5,7 @@
 
 import ast
 import argparse
+import atexit
 import base64
 import copy
 import getpass
@@ -24,7 +25,8 @@ from zmq.log.handlers import PUBHandler
 
 import urllib.parse
 import urllib.request
-from collections import Sequence, Mapping, Set, defaultdict, KeysView
+from collections import defaultdict
+from collections.abc import Sequence, Mapping, Set, KeysView
 from html.parser import HTMLParser
 from io import FileIO, StringIO, BytesIO
 from typing import Optional, List, Dict
@@ -87,16 +89,21 @@ def colorstr(astr: str, color: Optional[str] = None) -> str:
         return f'\033[{color_code}m{astr}\033[0m'
 
 
+_EMPH_RE = re.compile(r'``([^`]*)``')
+
+
 def emphasize(msg: str, color: Optional[str] = None):
     level_color = 0 if color is None else COLOR_CODE[color]
     # display text within `` and `` in green
+    if not isinstance(msg, str):
+        msg = str(msg)
     if sys.platform == 'win32':
-        return str(msg).replace('``', '')
+        return msg.replace('``', '')
     elif level_color == 0:
-        return re.sub(r'``([^`]*)``', '\033[32m\\1\033[0m', str(msg))
+        return _EMPH_RE.sub('\033[32m\\1\033[0m', msg)
     else:
-        return re.sub(r'``([^`]*)``',
-                      f'\033[0m\033[32m\\1\033[0m\033[{level_color}m', str(msg))
+        return _EMPH_RE.sub(
+            f'\033[0m\033[32m\\1\033[0m\033[{level_color}m', msg)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -116,61 +123,117 @@ class ColoredFormatter(logging.Formatter):
             'ERROR': 'RED',
             'CRITICAL': 'RED_BG',
         }
+        # level names and colors are fixed, so the ANSI sequences
+        # are built once instead of once per record
+        self._level_cache = {
+            level: (color, colorstr(level, color),
+                    '' if sys.platform == 'win32' else
+                    f'\033[{COLOR_CODE[color]}m',
+                    '' if sys.platform == 'win32' else '\033[0m')
+            for level, color in self.LEVEL_COLOR.items()
+        }
+        # colored logger names, keyed by (levelname, name). There are
+        # only a handful of logger names so this cache stays small.
+        self._name_cache = {}
 
     def format(self, record):
-        level_name = record.levelname
-        if level_name in self.LEVEL_COLOR:
-            level_color = self.LEVEL_COLOR[level_name]
-            record.color_levelname = colorstr(level_name, level_color)
-            record.color_name = colorstr(record.name, level_color)
-            record.color_msg = colorstr(
-                emphasize(record.msg, level_color), level_color)
+        cached = self._level_cache.get(record.levelname)
+        if cached is not None:
+            level_color, colored_levelname, color_start, color_end = cached
+            record.color_levelname = colored_levelname
+            try:
+                record.color_name = self._name_cache[record.levelname,
+                                                     record.name]
+            except KeyError:
+                record.color_name = self._name_cache[
+                    record.levelname,
+                    record.name] = color_start + record.name + color_end
+            record.color_msg = color_start + emphasize(
+                record.msg, level_color) + color_end
         else:
-            # for INFO, use default color
+            # for INFO, use default color. Most INFO messages carry no
+            # `` emphasis markers, in which case no color work is needed
+            # at all
             record.color_levelname = record.levelname
-            record.color_msg = emphasize(record.msg)
+            msg = record.msg if isinstance(record.msg,
+                                           str) else str(record.msg)
+            record.color_msg = emphasize(msg) if '``' in msg else msg
         # for testing certain error message
         # if 'runtime' in record.color_msg:
         #     print(get_traceback())
         return logging.Formatter.format(self, record)
 
 
+def _short_repr_str(obj):
+    if len(obj) > 80:
+        return '{}...{}'.format(obj[:60].replace('\n', '\\n'),
+                                obj[-20:].replace('\n', '\\n'))
+    return repr(obj)
+
+
+def _short_repr_sequence(obj):  # should be a list or tuple
+    if len(obj) == 0:
+        return '[]'
+    elif len(obj) == 1:
+        return f'{short_repr(obj[0])}'
+    elif len(obj) == 2:
+        return f'{short_repr(obj[0])}, {short_repr(obj[1])}'
+    else:
+        return f'{short_repr(obj[0])}, {short_repr(obj[1])}, ... ({len(obj)} items)'
+
+
+def _short_repr_dict(obj):
+    if not obj:
+        return ''
+    first_key = next(iter(obj))
+    if len(obj) == 1:
+        return f'{short_repr(first_key)!r}:{short_repr(obj[first_key])!r}'
+    else:
+        return f'{short_repr(first_key)}:{short_repr(obj[first_key])}, ... ({len(obj)} items)'
+
+
+def _short_repr_keys(obj):
+    if not obj:
+        return ''
+    elif len(obj) == 1:
+        return short_repr(next(iter(obj)))
+    else:
+        return f'{short_repr(next(iter(obj)))}, ... ({len(obj)} items)'
+
+
+# exact-type dispatch for the types that dominate actual calls, so that
+# they are handled with a single dict lookup instead of going through
+# the isinstance ladder in short_repr
+_SHORT_REPR_DISPATCH = {
+    str: _short_repr_str,
+    int: repr,
+    float: repr,
+    bool: repr,
+    list: _short_repr_sequence,
+    tuple: _short_repr_sequence,
+    dict: _short_repr_dict,
+}
+
+
 def short_repr(obj, noneAsNA=False):
     '''Return a short representation of obj for clarity.'''
     if obj is None:
         return 'unspecified' if noneAsNA else 'None'
+    dispatcher = _SHORT_REPR_DISPATCH.get(type(obj))
+    if dispatcher is not None:
+        return dispatcher(obj)
     elif isinstance(obj, str) and len(obj) > 80:
-        return '{}...{}'.format(obj[:60].replace('\n', '\\n'),
-                                obj[-20:].replace('\n', '\\n'))
+        return _short_repr_str(obj)
     elif isinstance(obj, (str, int, float, bool)):
         return repr(obj)
     elif hasattr(obj, '__short_repr__'):
         return obj.__short_repr__()
-    elif isinstance(obj, Sequence):  # should be a list or tuple
-        if len(obj) == 0:
-            return '[]'
-        elif len(obj) == 1:
-            return f'{short_repr(obj[0])}'
-        elif len(obj) == 2:
-            return f'{short_repr(obj[0])}, {short_repr(obj[1])}'
-        else:
-            return f'{short_repr(obj[0])}, {short_repr(obj[1])}, ... ({len(obj)} items)'
+    elif isinstance(obj, Sequence):
+        return _short_repr_sequence(obj)
     elif isinstance(obj, dict):
-        if not obj:
-            return ''
-        elif len(obj) == 1:
-            first_key = list(obj.keys())[0]
-            return f'{short_repr(first_key)!r}:{short_repr(obj[first_key])!r}'
-        else:
-            first_key = list(obj.keys())[0]
-            return f'{short_repr(first_key)}:{short_repr(obj[first_key])}, ... ({len(obj)} items)'
+        return _short_repr_dict(obj)
     elif isinstance(obj, KeysView):
-        if not obj:
-            return ''
-        elif len(obj) == 1:
-            return short_repr(next(iter(obj)))
-        else:
-            return f'{short_repr(next(iter(obj)))}, ... ({len(obj)} items)'
+        return _short_repr_keys(obj)
     #elif hasattr(obj, 'target_name'):
     #    return obj.target_name()
     else:
@@ -186,6 +249,12 @@ def short_repr(obj, noneAsNA=False):
 #
 
 
+# variables that can only be set by SoS itself
+_RESERVED_KEYS = frozenset(
+    ('input', 'output', 'depends', '_input', '_output', '_depends',
+     '_runtime'))
+
+
 class WorkflowDict(object):
     """A dictionary object that keeps all SoS workflow objects.
 
@@ -209,23 +278,21 @@ class WorkflowDict(object):
     def set(self, key, value):
         '''A short cut to set value to key without triggering any logging
         or warning message.'''
-        if hasattr(value, 'labels'):
-            if 'VARIABLE' in env.config['SOS_DEBUG'] or 'ALL' in env.config[
-                    'SOS_DEBUG']:
+        if 'VARIABLE' in env.config['SOS_DEBUG'] or 'ALL' in env.config[
+                'SOS_DEBUG']:
+            # short_repr can be expensive for large objects so the message
+            # is only built after the topic is known to be logged
+            if hasattr(value, 'labels'):
                 env.log_to_file(
                     'VARIABLE',
                     f"Set {key} to {short_repr(value)} with labels {short_repr(value.labels)}"
                 )
-        else:
-            if 'VARIABLE' in env.config['SOS_DEBUG'] or 'ALL' in env.config[
-                    'SOS_DEBUG']:
+            else:
                 env.log_to_file(
                     'VARIABLE',
                     f"Set {key} to {short_repr(value)} of type {value.__class__.__name__}"
                 )
         self._dict[key] = value
-        # if self._change_all_cap_vars is not None and key.isupper():
-        #    self._check_readonly(key, value)
 
     def quick_update(self, obj):
         '''Update without sanity check etc. For fast internal update'''
@@ -234,10 +301,9 @@ class WorkflowDict(object):
     def update(self, obj):
         '''Redefine update to trigger logging message'''
         self._dict.update(obj)
-        for k, v in obj.items():
-            # if k.isupper():
-            #    self._check_readonly(k, v)
-            if env.verbosity > 2:
+        if 'VARIABLE' in env.config['SOS_DEBUG'] or 'ALL' in env.config[
+                'SOS_DEBUG']:
+            for k, v in obj.items():
                 self._log(k, v)
 
     def __contains__(self, key):
@@ -253,20 +319,20 @@ class WorkflowDict(object):
 
     def __setitem__(self, key, value):
         '''Set value to key, trigger logging and warning messages if needed'''
-        if env.verbosity > 2:
+        if 'VARIABLE' in env.config['SOS_DEBUG'] or 'ALL' in env.config[
+                'SOS_DEBUG']:
             self._log(key, value)
         if env.config['run_mode'] == 'prepare':
             self._warn(key, value)
-        if key in ('input', 'output', 'depends', '_input', '_output',
-                   '_depends', '_runtime'):
+        if key in _RESERVED_KEYS:
             raise ValueError(f'Variable {key} can only be set by SoS')
         self.set(key, value)
 
     def _log(self, key, value):
-        if 'VARIABLE' in env.config['SOS_DEBUG'] or 'ALL' in env.config[
-                'SOS_DEBUG']:
-            env.log_to_file('VARIABLE',
-                            f'Set ``{key}`` = ``{short_repr(value)}``')
+        # callers check the SOS_DEBUG topic before calling, so the
+        # message is formatted only when it will be written
+        env.log_to_file('VARIABLE',
+                        f'Set ``{key}`` = ``{short_repr(value)}``')
 
     def _warn(self, key, value):
         if key.startswith('_') and not key.startswith('__') and key not in (
@@ -276,11 +342,27 @@ class WorkflowDict(object):
             )
 
     def clone_selected_vars(self, selected=None):
-        return {
-            x: copy.deepcopy(y)
-            for x, y in self._dict.items()
-            if (not selected or x in selected) and pickleable(y, x)
-        }
+        # a single pickle round-trip both tests picklability and clones
+        # the value, instead of pickle.dumps in pickleable() followed by
+        # an independent copy.deepcopy
+        res = {}
+        for x, y in self._dict.items():
+            if selected and x not in selected:
+                continue
+            if type(y) in _PICKLEABLE_TYPES or isinstance(
+                    y, (str, bool, int, float, complex, bytes)):
+                # immutable values do not need to be copied
+                res[x] = y
+                continue
+            if isinstance(y, (types.ModuleType, WorkflowDict)) or callable(y):
+                continue
+            try:
+                res[x] = pickle.loads(pickle.dumps(y))
+            except Exception as e:
+                env.logger.debug(
+                    f'Object {x} with value {short_repr(y)} is not passed because it is not pickleable: {e}'
+                )
+        return res
 
 
 #
@@ -381,6 +463,7 @@ class RuntimeEnvironments(object):
         self._logger = None
         self._verbosity: int = 2
         self._logging_socket = None
+        self._verbosity_handler = None
         self._set_logger()
 
         #
@@ -425,6 +508,15 @@ class RuntimeEnvironments(object):
     # attribute logger
     #
 
+    _VERBOSITY_LEVELS = {
+        0: logging.ERROR,
+        1: logging.WARNING,
+        2: logging.INFO,
+        3: logging.DEBUG,
+        4: logging.DEBUG,
+        None: logging.INFO
+    }
+
     def _set_logger(self, unused=None):
         # create a logger, we current use the regular logger but we should
         # switch to multiprocessing.get_logger if we notice trouble in, for example,
@@ -434,19 +526,13 @@ class RuntimeEnvironments(object):
         while self._logger.hasHandlers():
             self._logger.removeHandler(self._logger.handlers[0])
         self._logger.setLevel(logging.DEBUG)
-        levels = {
-            0: logging.ERROR,
-            1: logging.WARNING,
-            2: logging.INFO,
-            3: logging.DEBUG,
-            4: logging.DEBUG,
-            None: logging.INFO
-        }
+        levels = self._VERBOSITY_LEVELS
 
         if self._logging_socket:
             socket_handler = PUBHandler(self._logging_socket)
             # debug informaiton and time is always written to the log file
             socket_handler.setLevel(levels[self._verbosity])
+            self._verbosity_handler = socket_handler
 
             #ch.setFormatter(logging.Formatter(
             #    '%(asctime)s: %(levelname)s: %(message)s'))
@@ -465,6 +551,7 @@ class RuntimeEnvironments(object):
             cout.setFormatter(
                 ColoredFormatter('%(color_levelname)s: %(color_msg)s'))
             self._logger.addHandler(cout)
+            self._verbosity_handler = cout
 
         if 'SOS_DEBUG' in os.environ and os.environ['SOS_DEBUG']:
             logfile_info = [
@@ -531,8 +618,13 @@ class RuntimeEnvironments(object):
     def _set_verbosity(self, v):
         if v in [0, 1, 2, 3, 4]:
             self._verbosity = v
-            # reset logger to appropriate logging level
-            self._set_logger()
+            # only the level of the console (or socket) handler depends
+            # on verbosity, so adjust it in place instead of tearing
+            # down and recreating all handlers
+            if self._verbosity_handler is not None:
+                self._verbosity_handler.setLevel(self._VERBOSITY_LEVELS[v])
+            else:
+                self._set_logger()
 
     #
     verbosity = property(lambda self: self._verbosity, _set_verbosity)
@@ -555,6 +647,9 @@ logger = env.logger
 #
 # String formatting
 #
+_WHITESPACE_RE = re.compile('[ \t\r\n]+')
+
+
 class _DeHTMLParser(HTMLParser):
     '''This parser analyzes input text, removes HTML tags such as
     <p>, <br>, <ul>, <li> etc and returns properly formatted texts.
@@ -562,36 +657,34 @@ class _DeHTMLParser(HTMLParser):
 
     def __init__(self):
         HTMLParser.__init__(self)
-        self.__text = []
+        self.__text = StringIO()
 
     def handle_data(self, data):
         text = data.strip()
         if len(text) > 0:
-            text = re.sub('[ \t\r\n]+', ' ', text)
-            self.__text.append(text + ' ')
+            text = _WHITESPACE_RE.sub(' ', text)
+            self.__text.write(text + ' ')
 
     def handle_starttag(self, tag, attrs):
         if tag == 'p':
-            self.__text.append('\n\n\n\n')
+            self.__text.write('\n\n\n\n')
         elif tag == 'br':
-            self.__text.append('\n\n')
-        elif tag == 'ul':
-            self.__text.append('')
+            self.__text.write('\n\n')
         elif tag == 'li':
-            self.__text.append('\n\n  * ')
+            self.__text.write('\n\n  * ')
 
     def handle_endtag(self, tag):
         if tag == 'ul':
-            self.__text.append('\n\n')
+            self.__text.write('\n\n')
         if tag == 'li':
-            self.__text.append('\n\n')
+            self.__text.write('\n\n')
 
     def handle_startendtag(self, tag, attrs):
         if tag == 'br':
-            self.__text.append('\n\n')
+            self.__text.write('\n\n')
 
     def text(self):
-        return ''.join(self.__text).strip()
+        return self.__text.getvalue().strip()
 
 
 def dehtml(text):
@@ -692,7 +785,15 @@ def get_traceback():
     # print "*** tb_lineno:", exc_traceback.tb_lineno
 
 
+# exact types that are always pickleable, checked with a single set
+# lookup before falling back to the isinstance tests
+_PICKLEABLE_TYPES = frozenset(
+    (str, bool, int, float, complex, bytes, type(None)))
+
+
 def pickleable(obj, name):
+    if type(obj) in _PICKLEABLE_TYPES:
+        return True
     if isinstance(obj, (str, bool, int, float, complex, bytes)):
         return True
     if isinstance(obj, (types.ModuleType, WorkflowDict)):
@@ -746,11 +847,13 @@ def stable_repr(obj):
 def get_output(cmd, show_command=False, prompt='$ '):
     import subprocess
     try:
+        # text mode decodes the output as it is read instead of
+        # buffering all bytes and decoding a second full copy
         output = subprocess.check_output(
-            cmd, stderr=subprocess.DEVNULL, shell=True).decode()
+            cmd, stderr=subprocess.DEVNULL, shell=True, text=True)
     except subprocess.CalledProcessError as e:
-        if e.output.decode():
-            env.logger.error(e.output.decode())
+        if e.output:
+            env.logger.error(e.output)
         raise RuntimeError(e)
     if show_command:
         return f'{prompt}{cmd}\n{output}'
@@ -763,6 +866,33 @@ def get_output(cmd, show_command=False, prompt='$ '):
 #
 
 
+# parsed sos_path from the global config file, together with the mtime
+# of the file so that edits are picked up
+_sos_path_cache: Dict = {}
+
+# names of entries of search-path directories, keyed by directory and
+# validated by its mtime, so that searching many paths does not issue
+# one stat per path
+_dir_index_cache: Dict = {}
+
+
+def _dir_index(path):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return frozenset()
+    cached = _dir_index_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        try:
+            with os.scandir(path) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except OSError:
+            names = frozenset()
+        _dir_index_cache[path] = (mtime, names)
+        return names
+    return cached[1]
+
+
 def locate_script(filename, start=''):
     #
     attemp = os.path.abspath(os.path.expanduser(filename))
@@ -790,22 +920,32 @@ def locate_script(filename, start=''):
     sos_config_file = os.path.join(
         os.path.expanduser('~'), '.sos', 'config.yml')
     if os.path.isfile(sos_config_file):
-        try:
-            with open(sos_config_file) as config:
-                cfg = yaml.safe_load(config)
-        except Exception:
-            raise RuntimeError(
-                f'Failed to parse global sos config file {sos_config_file}, is it in JSON format?'
-            )
-        #
-        pathes.extend(cfg.get('sos_path', []))
+        mtime = os.path.getmtime(sos_config_file)
+        if _sos_path_cache.get('mtime') != mtime:
+            try:
+                with open(sos_config_file) as config:
+                    cfg = yaml.safe_load(config)
+            except Exception:
+                raise RuntimeError(
+                    f'Failed to parse global sos config file {sos_config_file}, is it in JSON format?'
+                )
+            _sos_path_cache['mtime'] = mtime
+            _sos_path_cache['sos_path'] = cfg.get('sos_path', [])
+        pathes.extend(_sos_path_cache['sos_path'])
     #
+    expanded_filename = os.path.expanduser(filename)
     for path in pathes:
         if not path:
             continue
-        attemp = os.path.join(
-            os.path.expanduser(path), os.path.expanduser(filename))
-        if os.path.isfile(attemp):
+        expanded_path = os.path.expanduser(path)
+        attemp = os.path.join(expanded_path, expanded_filename)
+        # for a plain filename, a cached directory listing rules out
+        # most search paths without a stat call each
+        if os.path.sep in expanded_filename:
+            if os.path.isfile(attemp):
+                return ('', attemp)
+        elif expanded_filename in _dir_index(
+                expanded_path) and os.path.isfile(attemp):
             return ('', attemp)
         # is it an URL?
         token = urllib.parse.urlparse(path)
@@ -929,24 +1069,44 @@ def as_fstring(text):
     return repr(''.join(pieces)) + '.format(' + ', '.join(args) + ')'
 
 
+_NATURAL_KEY_RE = re.compile(r'(\d+)')
+
+
 def natural_keys(text):
     '''
     alist.sort(key=natural_keys) sorts in human order
     http://nedbatchelder.com/blog/200712/human_sorting.html
     (See Toothy's implementation in the comments)
     '''
-    return [int(c) if c.isdigit() else c for c in re.split(r'(\d+)', text)]
+    return [
+        int(c) if c.isdigit() else c for c in _NATURAL_KEY_RE.split(text)
+    ]
+
+
+# open transcript files, keyed by file name; opening the file once and
+# keeping the handle avoids an open/close syscall pair per transcribed
+# command
+_transcript_handles: Dict = {}
 
 
 def transcribe(text, cmd=None):
     if cmd is not None:
-        text = '{}:\n{}'.format(cmd,
-                                '    ' + text.replace('\n', '\n    ') + '\n')
+        body = text.replace('\n', '\n    ') if '\n' in text else text
+        text = f'{cmd}:\n    {body}\n'
     with fasteners.InterProcessLock(
             os.path.join(env.temp_dir, 'transcript.lck')):
-        with open(os.path.join(env.exec_dir, '.sos', 'transcript.txt'),
-                  'a') as trans:
-            trans.write(text)
+        filename = os.path.join(env.exec_dir, '.sos', 'transcript.txt')
+        trans = _transcript_handles.get(filename)
+        if trans is None or trans.closed:
+            # append mode keeps writes from concurrent processes at the
+            # end of the file
+            trans = open(filename, 'a')
+            _transcript_handles[filename] = trans
+            atexit.register(trans.close)
+        trans.write(text)
+        # flush while holding the lock so entries from different
+        # processes do not interleave
+        trans.flush()
 
 
 def dict_merge(dct, merge_dct):
@@ -975,9 +1135,17 @@ def pretty_size(n,
                 b=1024,
                 u='B',
                 pre=[''] + [p + 'i' for p in 'KMGTPEZY']):
-    pow, n = min(int(math.log(max(n * b**pow, 1), b)), len(pre) - 1), n * b**pow
-    return "%%.%if %%s%%s" % abs(pow %
-                                 (-pow - 1)) % (n / b**float(pow), pre[pow], u)
+    n = n * b**pow
+    # walk the thresholds instead of computing log/pow and building the
+    # format string for every call
+    amount = float(max(n, 1))
+    for pow, prefix in enumerate(pre):
+        if amount < b or pow == len(pre) - 1:
+            break
+        amount /= b
+    if pow == 0:
+        return '%.0f %s%s' % (n, prefix, u)
+    return '%.1f %s%s' % (n / b**pow, prefix, u)
 
 
 def expand_size(size):
@@ -1276,7 +1444,38 @@ class TimeoutInterProcessLock(fasteners.InterProcessLock):
                     msg = True
 
 
+# fully processed configurations, keyed by the names and mtimes of the
+# config files they were read from. reset_dict clears env.sos_dict and
+# reloads the configuration for every step and nested workflow, so
+# reparsing the same unchanged YAML files each time is pure overhead.
+_config_cache: Dict = {}
+
+
 def load_config_files(filename=None):
+    if filename is None and 'config_file' in env.config:
+        filename = env.config['config_file']
+    config_files = [
+        os.path.join(os.path.split(__file__)[0], 'site_config.yml'),
+        os.path.join(os.path.expanduser('~'), '.sos', 'hosts.yml'),
+        os.path.join(os.path.expanduser('~'), '.sos', 'config.yml'),
+    ]
+    if filename is not None:
+        if not os.path.isfile(os.path.expanduser(filename)):
+            raise RuntimeError(f'Config file {filename} not found')
+        config_files.append(os.path.expanduser(filename))
+    cache_key = tuple(
+        (x, os.path.getmtime(x)) for x in config_files if os.path.isfile(x))
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        # a copy is set so that modifications to CONFIG by one step do
+        # not propagate to the next
+        res = copy.deepcopy(cached)
+        env.sos_dict.set('CONFIG', res)
+        return res
+    return _load_config_files(filename, cache_key)
+
+
+def _load_config_files(filename, cache_key):
     cfg = {}
     # site configuration file
     sos_config_file = os.path.join(
@@ -1407,6 +1606,7 @@ def load_config_files(filename=None):
         else:
             res[k] = v
     env.sos_dict.set('CONFIG', res)
+    _config_cache[cache_key] = copy.deepcopy(res)
     return res
 
 
@@ -5,8 +5,10 @@
 
 import multiprocessing as mp
 import os
+import pickle
 import signal
 import time
+from collections import deque
 from typing import Any, Dict, Optional
 
 import zmq
@@ -14,13 +16,21 @@ import zmq
 from .controller import (close_socket, connect_controllers, create_socket,
                          disconnect_controllers)
 from .executor_utils import kill_all_subprocesses, prepare_env
+from .step_executor import Step_Executor
+from .substep_executor import execute_substep
 from .utils import env, ProcessKilled, short_repr
+from .workflow_executor import Base_Executor
 
 
 def signal_handler(*args, **kwargs):
     raise ProcessKilled()
 
 
+# yielded by run_workflow/run_step when they complete, so that the
+# Runner can detect completion without a StopIteration round-trip
+_DONE_SENTINEL = object()
+
+
 class Runner(object):
     '''
     This runner class takea a generator function and run it.
@@ -43,21 +53,29 @@ class Runner(object):
         return self._name
 
     def run_until_waiting(self):
+        # bind the generator's send and the current poller to locals;
+        # this loop wakes up for every message of a running step
+        resume = self._runner.send
+        poller = self._poller
         try:
             # if poller is not initialized, run the runner to get the first poller
-            if self._poller == 0:
-                self._poller = next(self._runner)
+            if poller == 0:
+                poller = next(self._runner)
 
             while True:
-                if self._poller is None:
-                    self._poller = self._runner.send(None)
+                if poller is _DONE_SENTINEL:
+                    return True
+
+                if poller is None:
+                    poller = resume(None)
                     continue
 
-                if self._poller.poll(200):
-                    self._poller = self._runner.send(None)
+                if poller.poll(200):
+                    poller = resume(None)
                     continue
 
                 # the poller is not ready, let us break
+                self._poller = poller
                 return self
         except StopIteration:
             return True
@@ -94,6 +112,9 @@ class SoS_Worker(mp.Process):
         # there can be multiple jobs for this worker, each using their own port and socket
         self._master_sockets = []
         self._master_ports = []
+        # how long to sleep when the controller has no job for us,
+        # doubling up to 100ms while idle
+        self._idle_wait = 0.001
         # current runner, which can be a runner or True if the runner has completed
         self._runners = []
         # env index, which contains sos_dict for each runner
@@ -201,23 +222,34 @@ class SoS_Worker(mp.Process):
                         )
                     break
                 if not reply:  # if an empty job is returned
-                    time.sleep(0.1)
+                    # back off exponentially so a worker that just
+                    # finished comes back for the next job almost
+                    # immediately while a long-idle worker settles at
+                    # one wakeup per 100ms. The REQ/REP protocol does
+                    # not allow waiting on the socket without sending
+                    # another request.
+                    time.sleep(self._idle_wait)
+                    if self._idle_wait < 0.1:
+                        self._idle_wait = min(self._idle_wait * 2, 0.1)
                     continue
+                self._idle_wait = 0.001
 
                 #
                 # if a real job is returned, run it. _process_job will either return True
                 # or a runner in case it is interrupted.
-                env.log_to_file(
-                    'WORKER',
-                    f'WORKER {self.name} ({os.getpid()}, {self.num_pending()} pending) receives {self._type_of_work(reply)} request {self._name_of_work(reply)} with master port {self._master_ports[new_idx]}'
-                )
-
-                if 'task' in reply:
-                    self.run_substep(reply)
+                if 'WORKER' in env.config['SOS_DEBUG'] or 'ALL' in env.config['SOS_DEBUG']:
                     env.log_to_file(
                         'WORKER',
-                        f'WORKER {self.name} ({os.getpid()}) completes substep {self._name_of_work(reply)}'
+                        f'WORKER {self.name} ({os.getpid()}, {self.num_pending()} pending) receives {self._type_of_work(reply)} request {self._name_of_work(reply)} with master port {self._master_ports[new_idx]}'
                     )
+
+                if 'task' in reply:
+                    self.run_substep(reply)
+                    if 'WORKER' in env.config['SOS_DEBUG'] or 'ALL' in env.config['SOS_DEBUG']:
+                        env.log_to_file(
+                            'WORKER',
+                            f'WORKER {self.name} ({os.getpid()}) completes substep {self._name_of_work(reply)}'
+                        )
                     self._runners[new_idx] = True
                     continue
 
@@ -274,15 +306,15 @@ class SoS_Worker(mp.Process):
         #
         #
         # get workflow, args, shared, and config
-        from .workflow_executor import Base_Executor
         env.config.update(config)
         # we are in a separate process and need to set verbosity from workflow config
         # but some tests do not provide verbosity
         env.verbosity = config.get('verbosity', 2)
-        env.log_to_file(
-            'WORKER',
-            f'Worker {self.name} working on a workflow {workflow_id} with args {short_repr(args)}'
-        )
+        if 'WORKER' in env.config['SOS_DEBUG'] or 'ALL' in env.config['SOS_DEBUG']:
+            env.log_to_file(
+                'WORKER',
+                f'Worker {self.name} working on a workflow {workflow_id} with args {short_repr(args)}'
+            )
 
         executer = Base_Executor(wf, args=args, shared=shared, config=config)
         # we send the socket to subworkflow, which would send
@@ -294,23 +326,24 @@ class SoS_Worker(mp.Process):
                 parent_socket=env.master_socket,
                 my_workflow_id=workflow_id)
             try:
+                resume = runner.send
                 yreq = next(runner)
                 while True:
                     yres = yield yreq
-                    yreq = runner.send(yres)
+                    yreq = resume(yres)
             except StopIteration:
                 pass
 
         except Exception as e:
             env.master_socket.send_pyobj(e)
+        yield _DONE_SENTINEL
 
     def run_step(self, section, context, shared, args, config, verbosity):
-        from .step_executor import Step_Executor
-
-        env.log_to_file(
-            'WORKER',
-            f'Worker {self.name} working on {section.step_name()} with args {short_repr(args)}'
-        )
+        if 'WORKER' in env.config['SOS_DEBUG'] or 'ALL' in env.config['SOS_DEBUG']:
+            env.log_to_file(
+                'WORKER',
+                f'Worker {self.name} working on {section.step_name()} with args {short_repr(args)}'
+            )
         env.config.update(config)
         env.verbosity = verbosity
         #
@@ -325,26 +358,26 @@ class SoS_Worker(mp.Process):
         for k in ['__step_input__', '__default_output__', '__step_output__']:
             if k in env.sos_dict:
                 env.sos_dict.pop(k)
-        # if the step has its own context
-        env.sos_dict.quick_update(shared)
-        # context should be updated after shared because context would contain the
+        # if the step has its own context. Merged into a single update;
+        # context comes after shared because context would contain the
         # correct __step_output__ of the step, whereas shared might contain
         # __step_output__ from auxiliary steps. #526
-        env.sos_dict.quick_update(context)
+        env.sos_dict.quick_update({**shared, **context})
         executor = Step_Executor(
             section, env.master_socket, mode=env.config['run_mode'])
 
         runner = executor.run()
         try:
+            resume = runner.send
             yreq = next(runner)
             while True:
                 yres = yield yreq
-                yreq = runner.send(yres)
+                yreq = resume(yres)
         except StopIteration:
             pass
+        yield _DONE_SENTINEL
 
     def run_substep(self, work):
-        from .substep_executor import execute_substep
         execute_substep(**work)
 
 
@@ -362,11 +395,18 @@ class WorkerManager(object):
         self._worker_alive_time = time.time()
         self._last_pending_time = {}
 
-        self._substep_requests = []
+        # substeps are queued FIFO; a deque gives O(1) appendleft
+        # where the previous list paid an O(n) insert(0, ...)
+        self._substep_requests = deque()
         self._step_requests = {}
 
         self._worker_backend_socket = backend_socket
 
+        # constant replies, pickled once instead of once per event;
+        # workers receive them with recv_pyobj as before
+        self._empty_reply = pickle.dumps({})
+        self._none_reply = pickle.dumps(None)
+
         # ports of workers working for blocking workflow
         self._blocking_ports = set()
 
@@ -388,7 +428,7 @@ class WorkerManager(object):
     def add_request(self, msg_type, msg):
         self._n_requested += 1
         if msg_type == 'substep':
-            self._substep_requests.insert(0, msg)
+            self._substep_requests.appendleft(msg)
             self.report(f'Substep requested')
         else:
             port = msg['config']['sockets']['master_port']
@@ -437,33 +477,40 @@ class WorkerManager(object):
         A non-zero num_pending means that the worker is pending on something while
         looking for new job, so the worker should not be killed.
         '''
-        if any(port in self._step_requests for port in ports):
+        # bind the hot collections to locals; each incoming event used
+        # to rescan ports against them with repeated any()/list
+        # comprehensions
+        step_requests = self._step_requests
+        claimed_ports = self._claimed_ports
+        blocking_ports = self._blocking_ports
+        available_ports = self._available_ports
+        step_port = next((x for x in ports if x in step_requests), None)
+        if step_port is not None:
             # if the port is available
-            port = [x for x in ports if x in self._step_requests][0]
             self._worker_backend_socket.send_pyobj(
-                self._step_requests.pop(port))
+                step_requests.pop(step_port))
             self._n_processed += 1
-            self.report(f'Step {port} processed')
+            self.report(f'Step {step_port} processed')
             # port should be in claimed ports
-            self._claimed_ports.remove(port)
+            claimed_ports.remove(step_port)
             if ports[0] in self._last_pending_time:
                 self._last_pending_time.pop(ports[0])
-        elif any(port in self._claimed_ports for port in ports):
+        elif any(port in claimed_ports for port in ports):
             # the port is claimed, but the real message is not yet available
-            self._worker_backend_socket.send_pyobj({})
+            self._worker_backend_socket.send(self._empty_reply)
             self.report(f'pending with claimed {ports}')
-        elif any(port in self._blocking_ports for port in ports):
+        elif any(port in blocking_ports for port in ports):
             # in block list but appear to be idle, kill it
             self._max_workers -= 1
             env.logger.debug(
                 f'Reduce maximum number of workers to {self._max_workers} after completion of a blocking subworkflow.'
             )
             for port in ports:
-                if port in self._blocking_ports:
-                    self._blocking_ports.remove(port)
-                if port in self._available_ports:
-                    self._available_ports.remove(port)
-            self._worker_backend_socket.send_pyobj(None)
+                if port in blocking_ports:
+                    blocking_ports.remove(port)
+                if port in available_ports:
+                    available_ports.remove(port)
+            self._worker_backend_socket.send(self._none_reply)
             self._num_workers -= 1
             self.report(f'Blocking worker {ports} killed')
         elif self._substep_requests:
@@ -474,12 +521,12 @@ class WorkerManager(object):
             self.report(f'Substep processed with {ports[0]}')
             # port can however be in available ports
             for port in ports:
-                if port in self._available_ports:
-                    self._available_ports.remove(port)
+                if port in available_ports:
+                    available_ports.remove(port)
                 if port in self._last_pending_time:
                     self._last_pending_time.pop(port)
         elif request_blocking:
-            self._worker_backend_socket.send_pyobj({})
+            self._worker_backend_socket.send(self._empty_reply)
             return ports[0]
         elif num_pending == 0 and self._num_workers > 1 and ports[
                 0] in self._last_pending_time and time.time(
@@ -488,7 +535,7 @@ class WorkerManager(object):
             for port in ports:
                 if port in self._available_ports:
                     self._available_ports.remove(port)
-            self._worker_backend_socket.send_pyobj(None)
+            self._worker_backend_socket.send(self._none_reply)
             self._num_workers -= 1
             self.report(f'Kill standing {ports}')
             self._last_pending_time.pop(ports[0])
@@ -496,7 +543,7 @@ class WorkerManager(object):
             if num_pending == 0 and ports[0] not in self._last_pending_time:
                 self._last_pending_time[ports[0]] = time.time()
             self._available_ports.add(ports[0])
-            self._worker_backend_socket.send_pyobj({})
+            self._worker_backend_socket.send(self._empty_reply)
             ports = tuple(ports)
             if (ports, num_pending) not in self._last_pending_msg or time.time(
             ) - self._last_pending_msg[(ports, num_pending)] > 1.0:
@@ -530,7 +577,7 @@ class WorkerManager(object):
         '''Kill all workers'''
         while self._num_workers > 0 and self._worker_backend_socket.poll(1000):
             msg = self._worker_backend_socket.recv_pyobj()
-            self._worker_backend_socket.send_pyobj(None)
+            self._worker_backend_socket.send(self._none_reply)
             self._num_workers -= 1
             self.report(f'Kill {msg[1:]}')
         # join all processes
@@ -12,7 +12,8 @@ import time
 import uuid
 import zmq
 
-from collections import defaultdict, Sequence
+from collections import defaultdict
+from collections.abc import Sequence
 from io import StringIO
 from typing import Any, Dict, List, Optional, Union
 from threading import Event